@@ -0,0 +1,370 @@
+"""Benchmarks for the dictionary tooling in process_dictionary.py.
+
+Usage:
+    python bench_dictionary.py parse [--lines N]
+    python bench_dictionary.py search [--sizes 200,10000,100000]
+    python bench_dictionary.py link [--sizes 1000,10000,100000]
+    python bench_dictionary.py pipeline [--sizes 1000,...,1000000] [--json PATH]
+
+"parse" first checks that the compiled line grammar produces the same entries
+as the old three-regex cascade over data/glossary (the golden output), except
+for the lines in GOLDEN_SHAPES, whose expected split is spelled out, then
+reports throughput of both in lines/sec.
+
+"search" builds the prebuilt search index for synthetic dictionaries of each
+size and compares its query latency with the scan Dictionary.tsx does on
+every keystroke (filter, sort, group by letter).
+
+"link" times the Aho-Corasick term linker against the curriculum subtopics for
+synthetic dictionaries of each size, next to a naive term x field scan for the
+sizes where that finishes in reasonable time.
+
+"pipeline" generates synthetic glossaries of each size with the line shapes
+found in data/glossary, runs the full importer with --profile on a scratch copy
+of the curriculum and reports throughput, peak memory and per-stage time. With
+--json every result is appended as one JSON line, to track regressions.
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+import process_dictionary as pd
+import term_linker
+
+GLOSSARY_GLOB = os.path.join(pd.ROOT_DIR, "data", "glossary", "*.txt")
+
+
+def legacy_parse_line(line):
+    # The cascade process_dictionary.py used before the compiled grammar,
+    # including its en-dash cleanup; kept as the golden reference.
+    match1 = re.match(r'^(.+?)\s*\(\s*(.+?)\s*\).*?[:]\s*(.+)$', line)
+    match2 = re.match(r'^(.+?)\s*[:]\s*\(\s*(.+?)\s*\)\s*(.+)$', line)
+    match3 = re.match(r'^(.+?)\s*[:]\s*(.+)$', line)
+    if match1:
+        tr, term, definition = (g.strip() for g in match1.groups())
+    elif match2:
+        tr, term, definition = (g.strip() for g in match2.groups())
+    elif match3:
+        tr, definition = (g.strip() for g in match3.groups())
+        term = tr
+    elif ':' in line:
+        tr, definition = (p.strip() for p in line.split(':', 1))
+        term = tr
+    else:
+        return None
+    if "–" in term:
+        term = term.split("–")[0].strip()
+    if "–" in tr:
+        tr = tr.split("–")[0].strip()
+    return tr, term, definition
+
+
+def glossary_lines():
+    lines = []
+    for path in sorted(glob.glob(GLOSSARY_GLOB)):
+        with open(path, "r", encoding="utf-8-sig") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    return lines
+
+
+# Line shapes with the split the grammar must produce, spelled out where the
+# cascade got them wrong (nested parentheses, a Turkish alias taken as the EN);
+# a glossary line listed here is checked against this instead of the cascade.
+GOLDEN_SHAPES = [
+    ("Gerilim (Voltaj) ( Voltage) : Elektrik devresinde akım akmasına neden olan güç.",
+     ("Gerilim", "Voltage", "Elektrik devresinde akım akmasına neden olan güç.")),
+    ("Yük [Elektriksel] ( Load) : Enerji tüketen eleman",
+     ("Yük", "Load", "Enerji tüketen eleman")),
+    ("Anahtar (Switch) tipi : Devreyi açıp kapatan eleman",
+     ("Anahtar", "Switch", "Devreyi açıp kapatan eleman")),
+    ("Yük ( Load) [Elektriksel Yük] : Enerji tüketen eleman",
+     ("Yük", "Load", "Enerji tüketen eleman")),
+    ("Foo (Bar (baz)) : def", ("Foo", "Bar (baz)", "def")),
+    ("Foo (Bar (baz)) not : def", ("Foo", "Bar (baz)", "def")),
+    ("Foo : (Bar (baz)) def", ("Foo", "Bar (baz)", "def")),
+    ("Trafo – Transformatör (Transformer – Xfmr) : def", ("Trafo", "Transformer", "def")),
+    ("Foo [not] : def", ("Foo", "Foo", "def")),
+    ("no colon (x)", None),
+]
+
+
+def check_golden(lines):
+    shapes = dict(GOLDEN_SHAPES)
+    cases = [(line, legacy_parse_line(line), "cascade") for line in lines if line not in shapes]
+    cases += [(line, expected, "expected") for line, expected in GOLDEN_SHAPES]
+    mismatches = 0
+    for line, expected, source in cases:
+        parsed = pd.parse_line(line)
+        got = parsed[:3] if parsed else None
+        if got != expected:
+            mismatches += 1
+            print(f"MISMATCH {line!r}\n  grammar: {got}\n  {source}: {expected}")
+    return mismatches
+
+
+def lines_per_second(parse, lines, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            parse(line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def bench_parse(args):
+    golden = glossary_lines()
+    if not golden:
+        print(f"No glossary files match {GLOSSARY_GLOB}")
+        return 1
+    mismatches = check_golden(golden)
+    shapes = dict(GOLDEN_SHAPES)
+    cascade = sum(line not in shapes for line in golden)
+    total = cascade + len(shapes)
+    print(f"golden: {total - mismatches}/{total} lines as expected "
+          f"({cascade} glossary lines against the old cascade, "
+          f"{len(shapes)} spelled-out shapes)")
+
+    lines = (golden * (args.lines // len(golden) + 1))[:args.lines]
+    old = lines_per_second(legacy_parse_line, lines)
+    new = lines_per_second(pd.parse_line, lines)
+    print(f"cascade: {old:12,.0f} lines/sec")
+    print(f"grammar: {new:12,.0f} lines/sec ({new / old:.2f}x)")
+    return 1 if mismatches else 0
+
+
+def synthetic_entries(count, seed=0):
+    """Dictionary entries built from the words of data/glossary, reproducible per seed."""
+    parsed = [pd.parse_line(line) for line in glossary_lines()]
+    parsed = [p for p in parsed if p]
+    en_words = sorted({w for p in parsed for w in p.term.split()})
+    tr_words = sorted({w for p in parsed for w in p.tr.split()})
+    def_words = sorted({w for p in parsed for w in p.definition.split()})
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(count):
+        entries.append({
+            "term": " ".join(rng.choices(en_words, k=rng.randint(1, 3))),
+            "tr": " ".join(rng.choices(tr_words, k=rng.randint(1, 3))),
+            "category": "Engineering",
+            "definition": " ".join(rng.choices(def_words, k=rng.randint(6, 14))),
+        })
+    return entries
+
+
+def scan_search(entries, query):
+    # What Dictionary.tsx does per keystroke: filter, sort, then group by letter;
+    # filtering on the fields and folding the index uses, so both find the same entries
+    query = pd.normalize_key(query)
+    filtered = [e for e in entries if any(query in text for text in pd.search_text(e))]
+    filtered.sort(key=lambda e: pd.collation_key(e["term"]))
+    grouped = {}
+    for e in filtered:
+        grouped.setdefault(pd.group_letter(e["term"]), []).append(e)
+    return grouped
+
+
+def index_search(index, query):
+    grouped = {}
+    for offset in index.search(query):
+        entry = index.entries[offset]
+        grouped.setdefault(pd.group_letter(entry[0]), []).append(entry)
+    return grouped
+
+
+def same_results(indexed, scanned):
+    def rows(grouped):
+        return {letter: [[entry.get(field, "") for field in pd.ENTRY_FIELDS]
+                         if isinstance(entry, dict) else entry for entry in group]
+                for letter, group in grouped.items()}
+    return rows(indexed) == rows(scanned)
+
+
+def mean_latency(search, queries):
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def bench_search(args):
+    rng = random.Random(1)
+    for size in args.sizes:
+        entries = synthetic_entries(size)
+        words = [w for e in rng.sample(entries, min(len(entries), 50)) for w in e["term"].split()]
+        queries = [w[:n] for w in words[:args.queries] for n in (1, 2, 4, len(w))]
+
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            pd.write_search_index(directory, entries)
+            build = time.perf_counter() - start
+            index = pd.SearchIndex(directory)
+            for query in queries:
+                # Also warms the shard cache, as a client would
+                if not same_results(index_search(index, query), scan_search(entries, query)):
+                    print(f"MISMATCH {query!r}: index and scan return different entries")
+                    return 1
+            indexed = mean_latency(lambda q: index_search(index, q), queries)
+        scanned = mean_latency(lambda q: scan_search(entries, q), queries)
+        print(f"{size:>8,} entries: build {build:7.2f} s, "
+              f"scan {scanned * 1000:9.3f} ms/query, index {indexed * 1000:9.3f} ms/query "
+              f"({scanned / indexed:,.0f}x)")
+    return 0
+
+
+def naive_links(dictionary, categories):
+    texts = list(term_linker.subtopic_texts(categories))
+    links = {}
+    for entry in dictionary:
+        patterns = [re.compile(r"(?<!\w)" + re.escape(p) + r"(?!\w)")
+                    for p in set(pd.entry_key(entry)) if len(p) >= term_linker.MIN_PATTERN_LENGTH]
+        for node_id, text in texts:
+            if any(pattern.search(text) for pattern in patterns):
+                ids = links.setdefault(entry["term"], [])
+                if node_id not in ids:
+                    ids.append(node_id)
+    return links
+
+
+def bench_link(args):
+    with open(pd.DEFAULT_CURRICULUM, "r", encoding="utf-8") as f:
+        categories = json.load(f)["categories"]
+    scanned = sum(len(text) for _, text in term_linker.subtopic_texts(categories))
+    print(f"scanning {scanned:,} characters of subtopic text")
+    for size in args.sizes:
+        dictionary = synthetic_entries(size)
+        start = time.perf_counter()
+        automaton = term_linker.build_automaton(dictionary)
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        links = term_linker.link_terms(dictionary, categories)
+        total = time.perf_counter() - start
+        line = (f"{size:>8,} terms: {len(automaton.goto):,} states, build {build:6.2f} s, "
+                f"build + scan {total:6.2f} s, {len(links):,} terms linked")
+        if size <= args.naive_limit:
+            start = time.perf_counter()
+            naive = naive_links(dictionary, categories)
+            line += f", naive {time.perf_counter() - start:7.2f} s"
+            if naive != links:
+                line += " (MISMATCH)"
+        print(line)
+    return 0
+
+
+# The shapes glossary lines take in data/glossary, as format strings
+LINE_SHAPES = (
+    "{tr} ( {en}) : {definition}",
+    "{tr} ({en}) : {definition}",
+    "{tr} : ( {en}) {definition}",
+    "{tr} ( {en}) [{note}] : {definition}",
+    "{tr} –  {note} ( {en}) : {definition}",
+    "{tr}( {en}) : {definition}",
+    "{tr} : {definition}",
+)
+# One line in this many is noise the parser has to skip
+NOISE_EVERY = 50
+
+
+def synthetic_lines(count, seed=0):
+    """Yield ``count`` glossary lines in the bracket variants seen in data/glossary."""
+    rng = random.Random(seed)
+    entries = synthetic_entries(min(count, 50_000), seed)
+    for number in range(count):
+        if number % NOISE_EVERY == NOISE_EVERY - 1:
+            yield f"{rng.choice(entries)['definition']}"
+            continue
+        entry = entries[number % len(entries)]
+        # Suffixing the entry number keeps most terms unique past the pool size
+        yield rng.choice(LINE_SHAPES).format(
+            tr=f"{entry['tr']} {number}", en=f"{entry['term']} {number}",
+            note=rng.choice(entries)["tr"], definition=entry["definition"])
+
+
+def bench_pipeline(args):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            glossary = os.path.join(directory, f"glossary-{size}.txt")
+            with open(glossary, "w", encoding="utf-8") as f:
+                for line in synthetic_lines(size):
+                    f.write(line + "\n")
+            curriculum = os.path.join(directory, "master-curriculum.json")
+            shutil.copyfile(pd.DEFAULT_CURRICULUM, curriculum)
+            profile_path = os.path.join(directory, "profile.json")
+
+            argv = [glossary, "--curriculum", curriculum, "--profile-json", profile_path,
+                    "--workers", str(args.workers)]
+            if args.search_index:
+                argv += ["--search-index", os.path.join(directory, f"index-{size}")]
+            with contextlib.redirect_stdout(io.StringIO()):
+                pd.main(argv)
+            with open(profile_path, "r", encoding="utf-8") as f:
+                profile = json.load(f)
+
+            result = {"time": time.time(), "size": size, "workers": args.workers, **profile}
+            results.append(result)
+            stages = ", ".join(f"{stage} {seconds:.2f}s"
+                               for stage, seconds in profile["stages"].items())
+            print(f"{size:>9,} lines: {profile['lines_per_second']:>9,.0f} lines/sec, "
+                  f"peak {profile['peak_memory_bytes'] / 2 ** 20:7.1f} MiB ({stages})")
+
+    if args.json:
+        with open(args.json, "a", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for process_dictionary.py.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parse = commands.add_parser("parse", help="line grammar vs the old regex cascade")
+    parse.add_argument("--lines", type=int, default=100_000,
+                       help="number of glossary lines to time (default: 100000)")
+    parse.set_defaults(run=bench_parse)
+
+    search = commands.add_parser("search", help="search index vs a full scan per query")
+    search.add_argument("--sizes", default="200,10000,100000",
+                        type=lambda value: [int(size) for size in value.split(",")],
+                        help="comma separated dictionary sizes (default: 200,10000,100000)")
+    search.add_argument("--queries", type=int, default=20,
+                        help="words to derive queries from (default: 20)")
+    search.set_defaults(run=bench_search)
+
+    link = commands.add_parser("link", help="Aho-Corasick term linker vs a naive scan")
+    link.add_argument("--sizes", default="1000,10000,100000",
+                      type=lambda value: [int(size) for size in value.split(",")],
+                      help="comma separated dictionary sizes (default: 1000,10000,100000)")
+    link.add_argument("--naive-limit", type=int, default=1000,
+                      help="largest size to also run the naive scan for (default: 1000)")
+    link.set_defaults(run=bench_link)
+
+    pipeline = commands.add_parser("pipeline", help="profiled imports of synthetic glossaries")
+    pipeline.add_argument("--sizes", default="1000,10000,100000,1000000",
+                          type=lambda value: [int(size) for size in value.split(",")],
+                          help="comma separated line counts (default: 1000,10000,100000,1000000)")
+    pipeline.add_argument("--workers", type=int, default=1,
+                          help="passed to process_dictionary.py --workers (default: 1)")
+    pipeline.add_argument("--search-index", action="store_true",
+                          help="include writing the search index in the run")
+    pipeline.add_argument("--json", metavar="PATH",
+                          help="append one JSON line per size to PATH")
+    pipeline.set_defaults(run=bench_pipeline)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Compile the curriculum tree of master-curriculum.json into a flat index.
+
+Usage:
+    python curriculum_index.py [--curriculum PATH] [--output DIR]
+
+The categories -> topics -> subtopics tree is laid out in preorder as parallel
+arrays (id, parent index, depth, subtree end, title, en), so a subtree is the
+contiguous slice [i, ends[i]) and no lookup has to walk the tree. Alongside the
+arrays the build emits an id -> index map, a normalized keyword -> node ids
+inverted index and one chunk per category for lazy loading:
+
+    index.json               arrays, id map, keyword index, category table
+    categories/<id>.json     the category's slice of the arrays plus keywords
+
+The output, data/curriculum-index/ by default, is a build artifact: it is not
+committed and the app does not read it.
+
+The build fails if an id is repeated or a child's id does not continue its
+parent's numbering (category "1.0" -> topic "1.1" -> subtopic "1.1.1").
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from curriculum_store import atomic_write_json
+from process_dictionary import DEFAULT_CURRICULUM, ROOT_DIR, normalize_key
+
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, "data", "curriculum-index")
+INDEX_VERSION = 1
+CHILD_KEYS = ("topics", "subtopics", "children")
+
+
+def child_nodes(node):
+    for key in CHILD_KEYS:
+        if key in node:
+            return node[key]
+    return []
+
+
+def child_id(parent_id, parent_depth, position):
+    """The id the ``position``-th (1-based) child of ``parent_id`` is expected to have."""
+    if parent_id is None:
+        return f"{position}.0"
+    # Categories are numbered "N.0" but their topics continue from "N"
+    prefix = parent_id.split(".")[0] if parent_depth == 0 else parent_id
+    return f"{prefix}.{position}"
+
+
+class CompiledTree:
+    """Preorder parallel arrays of the curriculum tree."""
+
+    def __init__(self):
+        self.ids = []
+        self.parents = []
+        self.depths = []
+        self.ends = []
+        self.titles = []
+        self.ens = []
+        self.keywords = []
+        self.id_index = {}
+        self.errors = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, node, parent, depth, expected_id):
+        """Append ``node`` and its subtree in preorder, recording numbering errors."""
+        index = len(self.ids)
+        node_id = node.get("id")
+        if node_id in self.id_index:
+            self.errors.append(f"duplicate id {node_id!r} (first at node {self.id_index[node_id]})")
+        else:
+            self.id_index[node_id] = index
+        if node_id != expected_id:
+            parent_id = self.ids[parent] if parent >= 0 else "the root"
+            self.errors.append(f"id {node_id!r} under {parent_id} should be {expected_id!r}")
+
+        self.ids.append(node_id)
+        self.parents.append(parent)
+        self.depths.append(depth)
+        self.ends.append(index + 1)
+        self.titles.append(node.get("title", ""))
+        self.ens.append(node.get("en", ""))
+        self.keywords.append(node.get("keywords", []))
+        for position, child in enumerate(child_nodes(node), 1):
+            self.add(child, index, depth + 1, child_id(node_id, depth, position))
+        self.ends[index] = len(self.ids)
+
+    def _siblings(self, first, stop):
+        while first < stop:
+            yield first
+            first = self.ends[first]
+
+    def roots(self):
+        return self._siblings(0, len(self.ids))
+
+    def children(self, index):
+        return self._siblings(index + 1, self.ends[index])
+
+    def keyword_index(self):
+        """Normalized keyword -> ids of the nodes listing it, in tree order."""
+        index = {}
+        for node_id, keywords in zip(self.ids, self.keywords):
+            for keyword in keywords:
+                ids = index.setdefault(normalize_key(keyword), [])
+                if not ids or ids[-1] != node_id:
+                    ids.append(node_id)
+        return dict(sorted(index.items()))
+
+
+def compile_tree(categories):
+    tree = CompiledTree()
+    for position, category in enumerate(categories, 1):
+        tree.add(category, -1, 0, child_id(None, None, position))
+    return tree
+
+
+def _slice(tree, start, end):
+    return {
+        "start": start,
+        "ids": tree.ids[start:end],
+        "parents": tree.parents[start:end],
+        "depths": tree.depths[start:end],
+        "ends": tree.ends[start:end],
+        "titles": tree.titles[start:end],
+        "ens": tree.ens[start:end],
+    }
+
+
+def write_index(directory, categories):
+    """Compile ``categories`` and write the index; raises ValueError if the tree is invalid."""
+    tree = compile_tree(categories)
+    if tree.errors:
+        raise ValueError("invalid curriculum tree:\n  " + "\n  ".join(tree.errors))
+
+    chunk_dir = os.path.join(directory, "categories")
+    os.makedirs(chunk_dir, exist_ok=True)
+    table = []
+    for category, start in zip(categories, tree.roots()):
+        end = tree.ends[start]
+        chunk = f"categories/{tree.ids[start]}.json"
+        table.append({
+            "id": tree.ids[start],
+            "title": tree.titles[start],
+            "en": tree.ens[start],
+            "icon": category.get("icon", ""),
+            "start": start,
+            "end": end,
+            "chunk": chunk,
+        })
+        data = _slice(tree, start, end)
+        data["keywords"] = tree.keywords[start:end]
+        atomic_write_json(os.path.join(directory, chunk), data, separators=(",", ":"))
+    live = {os.path.basename(category["chunk"]) for category in table}
+    for name in os.listdir(chunk_dir):
+        if name not in live:
+            os.remove(os.path.join(chunk_dir, name))
+
+    index = {"version": INDEX_VERSION, "count": len(tree), "categories": table}
+    index.update(_slice(tree, 0, len(tree)))
+    index["id_index"] = tree.id_index
+    index["keywords"] = tree.keyword_index()
+    atomic_write_json(os.path.join(directory, "index.json"), index, separators=(",", ":"))
+    return tree
+
+
+class CurriculumIndex:
+    """Reader for index.json: O(1) id lookups and O(k) keyword search."""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as f:
+            self.index = json.load(f)
+        self.id_index = self.index["id_index"]
+        self.keywords = self.index["keywords"]
+
+    def node(self, node_id):
+        i = self.id_index.get(node_id)
+        if i is None:
+            return None
+        index = self.index
+        parent = index["parents"][i]
+        return {
+            "id": node_id,
+            "parent": index["ids"][parent] if parent >= 0 else None,
+            "depth": index["depths"][i],
+            "title": index["titles"][i],
+            "en": index["ens"][i],
+        }
+
+    def search_keyword(self, keyword):
+        return self.keywords.get(normalize_key(keyword), [])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the curriculum tree into a flat index.")
+    parser.add_argument("--curriculum", default=DEFAULT_CURRICULUM,
+                        help="curriculum JSON to read (default: data/master-curriculum.json)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="index directory (default: data/curriculum-index)")
+    args = parser.parse_args(argv)
+
+    with open(args.curriculum, "r", encoding="utf-8") as f:
+        categories = json.load(f).get("categories", [])
+    try:
+        tree = write_index(args.output, categories)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"Compiled {len(tree)} nodes in {len(categories)} categories to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Split, append-friendly storage for master-curriculum.json.
+
+Layout of a store directory:
+
+    categories.json            snapshot of the curriculum tree, refreshed by compaction
+    dictionary/manifest.json   ordered list of live segments
+    dictionary/00000001.jsonl  one {"op": ..., "entry": ...} record per line
+
+Appending entries writes a new segment and a new manifest, so the cost of an
+import is proportional to the entries it adds, not to the whole dictionary.
+Replaying the segments in order gives the dictionary: "add" records append an
+entry, "update" records replace the entry that first had the same key.
+Compaction folds the segments into one and regenerates the combined JSON the
+Next.js app imports. The categories are re-read from that JSON at compaction
+time, since the scripts/ tools edit them there in place.
+
+Every file is written to a temporary name and renamed into place, and the
+manifest is written after the segments it lists, so a crash mid-write leaves
+the previous state readable.
+"""
+
+import json
+import os
+
+MANIFEST_VERSION = 1
+OP_ADD = "add"
+OP_UPDATE = "update"
+
+
+def atomic_write(path, write):
+    """Call ``write(f)`` on a temporary file and rename it over ``path`` once complete."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def atomic_write_json(path, obj, **dump_kwargs):
+    atomic_write(path, lambda f: json.dump(obj, f, ensure_ascii=False, **dump_kwargs))
+
+
+def _exact_key(entry):
+    return entry.get("term"), entry.get("tr")
+
+
+class CurriculumStore:
+    """Categories and dictionary kept as separate shards under ``root``.
+
+    ``key`` maps an entry to the identity "update" records are matched on; it
+    should be the same key the importer deduplicates with.
+    """
+
+    def __init__(self, root, key=None):
+        self.root = root
+        self.key = key or _exact_key
+        self.categories_path = os.path.join(root, "categories.json")
+        self.dictionary_dir = os.path.join(root, "dictionary")
+        self.manifest_path = os.path.join(self.dictionary_dir, "manifest.json")
+
+    def exists(self):
+        return os.path.exists(self.manifest_path)
+
+    def init_from(self, curriculum_path):
+        """Create the store from a combined curriculum JSON file."""
+        with open(curriculum_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        os.makedirs(self.dictionary_dir, exist_ok=True)
+        atomic_write_json(self.categories_path, data.get("categories", []), indent=4)
+        manifest = {"version": MANIFEST_VERSION, "segments": [], "next_segment": 1}
+        records = [(OP_ADD, entry) for entry in data.get("dictionary", [])]
+        manifest["segments"].append(self._write_segment(manifest, records))
+        self._write_manifest(manifest)
+
+    def load_manifest(self):
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self, manifest):
+        atomic_write_json(self.manifest_path, manifest, indent=4)
+
+    def load_categories(self):
+        with open(self.categories_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def iter_records(self):
+        for name in self.load_manifest()["segments"]:
+            with open(os.path.join(self.dictionary_dir, name), "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield record["op"], record["entry"]
+
+    def load_dictionary(self):
+        """Replay every segment into the list of dictionary entries."""
+        entries = []
+        positions = {}
+        for op, entry in self.iter_records():
+            key = self.key(entry)
+            if op == OP_UPDATE and key in positions:
+                entries[positions[key]] = entry
+                continue
+            positions.setdefault(key, len(entries))
+            entries.append(entry)
+        return entries
+
+    def append(self, added, updated=()):
+        """Write ``added`` and ``updated`` entries as a new segment; returns its name or None."""
+        records = [(OP_ADD, entry) for entry in added]
+        records.extend((OP_UPDATE, entry) for entry in updated)
+        if not records:
+            return None
+
+        manifest = self.load_manifest()
+        manifest["segments"].append(self._write_segment(manifest, records))
+        self._write_manifest(manifest)
+        return manifest["segments"][-1]
+
+    def _write_segment(self, manifest, records):
+        # Claims the next segment number in ``manifest``; the caller saves the manifest
+        name = f"{manifest['next_segment']:08d}.jsonl"
+        manifest["next_segment"] += 1
+
+        def write(f):
+            for op, entry in records:
+                f.write(json.dumps({"op": op, "entry": entry}, ensure_ascii=False))
+                f.write("\n")
+
+        atomic_write(os.path.join(self.dictionary_dir, name), write)
+        return name
+
+    def compact(self, curriculum_path):
+        """Fold all segments into one and regenerate the combined curriculum JSON.
+
+        Everything but the dictionary is kept from the current ``curriculum_path``,
+        and its categories replace the snapshot in categories.json.
+        """
+        manifest = self.load_manifest()
+        dictionary = self.load_dictionary()
+        try:
+            with open(curriculum_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {"categories": self.load_categories()}
+        data["dictionary"] = dictionary
+        atomic_write_json(self.categories_path, data.get("categories", []), indent=4)
+        atomic_write_json(curriculum_path, data, indent=4)
+
+        old_segments = manifest["segments"]
+        records = [(OP_ADD, entry) for entry in dictionary]
+        manifest["segments"] = [self._write_segment(manifest, records)]
+        self._write_manifest(manifest)
+        for name in old_segments:
+            os.remove(os.path.join(self.dictionary_dir, name))
+        return len(dictionary)
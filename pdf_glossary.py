@@ -0,0 +1,242 @@
+"""Extract the vocabulary tables of a PDF as glossary lines for process_dictionary.py.
+
+Usage:
+    python pdf_glossary.py atomik-kaynak.pdf [--workers N] > glossary.txt
+
+Only the "Türkçe Terim | English Equivalent | Teknik Bağlam" tables are read
+(the "MESLEKİ İNGİLİZCE SÖZLÜĞÜ" sections of the course material); each row
+becomes "Türkçe Terim (English Equivalent) : Teknik Bağlam". Bullets and prose
+describe the curriculum, not terms, and are left out.
+
+Cells wrap over several baselines and tables run over page breaks, so rows are
+rebuilt from the position of every text fragment: fragments are grouped into
+rows by vertical gaps and into columns by the x positions of the header cells.
+
+process_dictionary.py also accepts .pdf inputs directly. Pages are extracted in
+a process pool and the fragments of each page are cached on disk under a hash
+of the page's content stream and resources, so re-running after the PDF changes
+only re-extracts the pages that changed. Requires the optional pypdf package.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from curriculum_store import atomic_write_json
+
+try:
+    import pypdf
+except ImportError:  # only needed when a PDF is actually read
+    pypdf = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "pdf-glossary")
+
+# Bumped whenever extraction or the page key changes, so stale cached pages are not reused
+CACHE_VERSION = 3
+
+# First two header cells of a vocabulary table; the third column is the context
+HEADER_CELLS = ("Türkçe Terim", "English Equivalent")
+# Baselines of one cell are at most ~15 pt apart (wrapped or vertically centred
+# lines), consecutive rows ~25 pt, so a larger gap starts a new row
+ROW_GAP = 20.0
+# Cell text starts at the column's x; prose and headings start ~2 pt further left
+COLUMN_TOLERANCE = 1.0
+
+_reader = None
+
+
+def _require_pypdf():
+    if pypdf is None:
+        raise SystemExit("Reading PDF glossaries needs pypdf: pip install pypdf")
+
+
+def _hash_object(digest, obj, memo):
+    # Feeds a PDF object and everything it references into ``digest``. Indirect
+    # objects are hashed once per document, since pages share fonts and forms.
+    if isinstance(obj, pypdf.generic.IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        if ref not in memo:
+            memo[ref] = b"cycle"  # placeholder until the object is hashed
+            sub = hashlib.sha256()
+            _hash_object(sub, obj.get_object(), memo)
+            memo[ref] = sub.digest()
+        digest.update(memo[ref])
+    elif isinstance(obj, dict):
+        for key in sorted(obj):
+            digest.update(key.encode())
+            _hash_object(digest, obj[key], memo)
+        # Image pixels do not change the text, and not every image filter decodes
+        if isinstance(obj, pypdf.generic.StreamObject) and obj.get("/Subtype") != "/Image":
+            digest.update(obj.get_data())
+    elif isinstance(obj, list):
+        digest.update(b"[")
+        for item in obj:
+            _hash_object(digest, item, memo)
+        digest.update(b"]")
+    else:
+        digest.update(repr(obj).encode())
+
+
+def page_key(page, memo=None):
+    """Cache key of a page: a hash of its content stream, its resources and the extractor version.
+
+    The resources are resolved down to their streams, so a font's ToUnicode map
+    or a form XObject drawn with "Do" changing also changes the key.
+    """
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{pypdf.__version__}:".encode())
+    contents = page.get_contents()
+    if contents is not None:
+        digest.update(contents.get_data())
+    _hash_object(digest, page.get("/Resources"), {} if memo is None else memo)
+    return digest.hexdigest()
+
+
+def _init_worker(path):
+    global _reader
+    _reader = pypdf.PdfReader(path)
+
+
+def _extract_page(number):
+    fragments = []
+
+    def visit(text, cm, tm, font, size):
+        if text.strip():
+            # Text space -> user space: the text matrix's origin through the CTM
+            x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            fragments.append([round(x, 1), round(y, 1), text])
+
+    _reader.pages[number].extract_text(visitor_text=visit)
+    return number, fragments
+
+
+class PageCache:
+    """Extracted page fragments stored as <cache_dir>/<page key>.json."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, fragments):
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write_json(self._path(key), fragments, separators=(",", ":"))
+
+
+def extract_pages(path, workers=None, cache_dir=DEFAULT_CACHE_DIR, stats=None):
+    """Return the [x, y, text] fragments of every page of ``path``, extracting only
+    pages not in the cache."""
+    _require_pypdf()
+    cache = PageCache(cache_dir)
+    reader = pypdf.PdfReader(path)
+    memo = {}
+    keys = [page_key(page, memo) for page in reader.pages]
+    texts = [cache.get(key) for key in keys]
+    missing = [number for number, text in enumerate(texts) if text is None]
+
+    if missing:
+        workers = min(workers or os.cpu_count() or 1, len(missing))
+        if workers > 1:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=(path,)) as executor:
+                extracted = list(executor.map(_extract_page, missing))
+        else:
+            _init_worker(path)
+            extracted = [_extract_page(number) for number in missing]
+        for number, text in extracted:
+            texts[number] = text
+            cache.put(keys[number], text)
+
+    if stats is not None:
+        stats["pages"] = len(texts)
+        stats["extracted"] = len(missing)
+    return texts
+
+
+def _bands(fragments):
+    # Groups a page's fragments, top to bottom, into runs of baselines less than
+    # ROW_GAP apart; each run is one table row (or one block of other text)
+    bands, last_y = [], None
+    for x, y, text in sorted(fragments, key=lambda f: (-f[1], f[0])):
+        if last_y is None or last_y - y >= ROW_GAP:
+            bands.append([])
+        bands[-1].append((x, y, text))
+        last_y = y
+    return bands
+
+
+def _starts_at(band, x):
+    return any(abs(fx - x) <= COLUMN_TOLERANCE for fx, _, _ in band)
+
+
+def _cell(band, start, end):
+    parts, last_y = [], None
+    for x, y, text in band:
+        if start - COLUMN_TOLERANCE <= x < end - COLUMN_TOLERANCE:
+            if last_y is not None and y != last_y and not parts[-1].endswith(" "):
+                parts.append(" ")
+            parts.append(text)
+            last_y = y
+    return " ".join("".join(parts).split())
+
+
+def iter_vocabulary_rows(pages):
+    """Yield (tr, en, context) for every row of the vocabulary tables in ``pages``.
+
+    ``pages`` are fragment lists as returned by extract_pages. A table starts at
+    its header row and ends at the first block not aligned with its first two
+    columns; the open table carries over to the next page.
+    """
+    columns = None
+    for fragments in pages:
+        for band in _bands(fragments):
+            texts = [text.strip() for _, _, text in band]
+            if all(cell in texts for cell in HEADER_CELLS):
+                columns = sorted(x for x, _, _ in band)
+            elif columns and _starts_at(band, columns[0]) and _starts_at(band, columns[1]):
+                bounds = columns[:3] + [float("inf")]
+                tr, en, context = (_cell(band, bounds[i], bounds[i + 1]) for i in range(3))
+                if tr and en:
+                    yield tr, en, context
+            else:
+                columns = None
+
+
+def read_pdf_lines(path, workers=None, cache_dir=DEFAULT_CACHE_DIR, stats=None):
+    """Glossary lines of a PDF, ready for process_dictionary.parse_lines."""
+    for tr, en, context in iter_vocabulary_rows(extract_pages(path, workers, cache_dir, stats)):
+        yield f"{tr} ({en}) : {context}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the vocabulary table rows of a PDF "
+                                                 "as glossary lines.")
+    parser.add_argument("pdf", help="PDF to read")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="extraction processes (default: one per CPU)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_DIR,
+                        help="extracted page cache directory (default: .cache/pdf-glossary)")
+    args = parser.parse_args(argv)
+
+    stats = {}
+    for line in read_pdf_lines(args.pdf, args.workers, args.cache, stats):
+        print(line)
+    print(f"{args.pdf}: {stats['pages']} pages, {stats['extracted']} extracted, "
+          f"{stats['pages'] - stats['extracted']} from cache", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,240 +1,751 @@
+"""Import glossary lines into the dictionary section of master-curriculum.json.
 
+Usage:
+    python process_dictionary.py data/glossary/*.txt
+    cat glossary.txt | python process_dictionary.py -
+    python process_dictionary.py atomik-kaynak.pdf
+
+Input is streamed line by line through read -> parse -> normalize -> emit,
+so glossaries of any size are processed without holding the text in memory.
+Entries already in the dictionary are matched on a normalized (term, tr) key,
+which makes re-imports idempotent; see --on-duplicate for the merge policy.
+
+With --search-index the prebuilt dictionary search index is rebuilt after an
+import that changed the dictionary, into data/dictionary-index/ unless another
+directory is given. It is a build artifact and is not committed.
+"""
+
+import argparse
+import collections
+import contextlib
+import glob
+import io
+import itertools
 import json
-import re
 import os
+import re
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import pdf_glossary
+from curriculum_store import CurriculumStore, atomic_write, atomic_write_json
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CURRICULUM = os.path.join(ROOT_DIR, "data", "master-curriculum.json")
+DEFAULT_SEARCH_INDEX = os.path.join(ROOT_DIR, "data", "dictionary-index")
+DEFAULT_COMPACT_EVERY = 16
+
+STDIN_SOURCE = "-"
+
+# Work units for --workers: byte ranges of input files, line batches of stdin
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+CHUNK_LINES = 20_000
+
+DUPLICATE_POLICIES = ("skip", "overwrite", "merge")
+MERGE_SEPARATOR = " / "
+
+# Which of the line shapes below a glossary line was parsed as
+PATTERN_TR_EN = "tr_en"              # TR (EN) : Def
+PATTERN_TR_COLON_EN = "tr_colon_en"  # TR : (EN) Def
+PATTERN_TR_ONLY = "tr_only"          # TR : Def
+PATTERNS = (PATTERN_TR_EN, PATTERN_TR_COLON_EN, PATTERN_TR_ONLY)
+
+# One pass over the line sorts it into one of the patterns above. Names may carry
+# an en-dash alias ("Transformatör – Trafo"), of which only the first is kept;
+# the EN may hold one level of nested parentheses ("Foo (Bar (baz))"). Bracketed
+# notes may come before "(EN)" ("Yük [Elektriksel] ( Load)") or any note after it
+# ("Yük ( Load) [Elektriksel Yük]", "Anahtar (Switch) tipi"). Of several groups
+# the last is the EN, the others are Turkish aliases ("Gerilim (Voltaj) ( Voltage)").
+_EN = r"[^()–]*[^()–\s](?:\s*\([^()]*\)(?:[^()–]*[^()–\s])?)*"
+LINE_RE = re.compile(r"""
+    ^\s*
+    (?P<tr>[^:()\[\]–]*[^:()\[\]–\s])(?:\s*–[^:()\[\]]*)?\s*
+    (?:\[[^\[\]:]*\]\s*)*
+    (?:(?:\([^():]*\)\s*)*\(\s*(?P<en>{en})(?:\s*–[^()]*)?\s*\))?
+    (?(en)[^:]*|(?:[(\[][^:]*)?)
+    \s*:\s*
+    (?(en)|(?:\(\s*(?P<en_after>{en})(?:\s*–[^()]*)?\s*\)\s*)?)
+    (?P<definition>\S(?:.*\S)?)\s*$
+""".format(en=_EN), re.VERBOSE)
+
+ParsedLine = namedtuple("ParsedLine", "tr term definition pattern")
+
+# Turkish dotted/dotless i must be folded before str.lower(), which maps "I" to "i"
+_TR_CASEFOLD = str.maketrans({"I": "ı", "İ": "i"})
+# Match keys cannot tell Turkish from English text ("Impedance", "Işık"), so every
+# dotted and dotless i folds to the same letter; only collation keeps them apart
+_I_FOLD = str.maketrans({"I": "i", "İ": "i", "ı": "i"})
+_TR_UPPER = str.maketrans({"i": "İ", "ı": "I"})
+_BRACKETS_RE = re.compile(r"[()\[\]{}]")
+_SPACES_RE = re.compile(r"\s+")
+
+
+class SourceStats:
+    """Per-input counters reported at the end of a run."""
+
+    def __init__(self, name):
+        self.name = name
+        self.accepted = 0
+        self.skipped = 0
+        self.patterns = collections.Counter()
+
+    def __str__(self):
+        return f"{self.name}: {self.accepted} accepted, {self.skipped} skipped"
+
+
+def expand_sources(patterns):
+    # "-" means stdin, everything else is a path or a glob pattern
+    for pattern in patterns:
+        if pattern == STDIN_SOURCE:
+            yield STDIN_SOURCE
+            continue
+        matches = sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+        if not matches:
+            raise FileNotFoundError(f"no input file matches {pattern!r}")
+        yield from matches
+
+
+def _stdin_lines():
+    # Files are opened as utf-8-sig; strip a BOM from piped input the same way
+    lines = iter(sys.stdin)
+    first = next(lines, None)
+    if first is None:
+        return
+    yield first[1:] if first.startswith("\ufeff") else first
+    yield from lines
+
+
+def read_lines(source):
+    if source == STDIN_SOURCE:
+        yield from _stdin_lines()
+        return
+    with open(source, "r", encoding="utf-8-sig") as f:
+        yield from f
+
+
+def parse_line(line):
+    """Split a glossary line into a ParsedLine, or None if it is not one."""
+    match = LINE_RE.match(line)
+    if match is None:
+        return None
+    tr, en, en_after, definition = match.group("tr", "en", "en_after", "definition")
+    if en is not None:
+        return ParsedLine(tr, en, definition, PATTERN_TR_EN)
+    if en_after is not None:
+        return ParsedLine(tr, en_after, definition, PATTERN_TR_COLON_EN)
+    return ParsedLine(tr, tr, definition, PATTERN_TR_ONLY)  # Fallback if no english found
+
+
+def _iter_parsed(lines):
+    # Yields a ParsedLine per glossary line and the raw text of every line that is not one
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        parsed = parse_line(line)
+        yield line if parsed is None else parsed
 
-# Absolute path to the file
-file_path = r"d:\Masaustu\master-plan\data\master-curriculum.json"
-
-raw_data = """
-Açık Devre (Open Circuit) : Devre anahtarının devreden akım geçmeyecek konumda olması durumu.
-Adi Anahtar : Bir lambayı veya bir grup lambayı aynı anda, aynı yerden yakıp söndürmeye yarayan anahtarlara denir.
-Admitans ( Admitance) : Alternatif gerilim devrelerinde empedans‘ın tersidir. Y ile gösterilir. Y=1/Z
-Akım ( Current) : İletkenin bir noktasından bir saniyede geçen elektron miktarı. Birimi Amper (A)’dir. I=V/R
-Akım Yoğunluğu ( Current Density) : İletkenin 1mm2’lik kesitinden geçen akım miktarına akım yoğunluğu denir. J harfi ile gösterilir. Birimi A/mm2’dir. J=I/S formülü ile hesaplanır. I=İletkenden geçen akım (A) S=İletkenin kesidi (mm2)
-Aktif Enerji : ( Real Energy) Aktif gücün zamanla çarpımıyla elde edilen enerji. Mesela 10 kW’lık bir motor 2 saat çalışırsa 2×10=20 kWh aktif enerji harcar.
-Aktif Güç ( Real Power) : Birimi Watt olan görünür gücün faz açısının kosinüsü ile çarpımı ile elde edilen elektriğin iş yapan gücü. P=VxIxcosφ
-Alçak Geçiren Filtre ( Low Pass Filter) : Düşük frekansları geçiren, alçak frekansları engelleyen filtre devresi.
-Alternans ( Alternans) : Her bir yarım saykıla alternans denir.
-Alternatif Akım ( Alternative Current) : Yönü ve büyüklüğü zamana göre sinüs dalgası biçiminde değişen akımdır.
-Ampermetre ( Ampermeter) : Doğru veya alternatif akım devrelerinde alıcının çektiği akımı ölçen ölçü aleti olup devreye seri bağlanır. Ampermetreler (A) harfi ile belirtilir.
-Anahtar ( Switch) : Devreyi açıp kapatmaya yarayan araçlardır.
-Anma Akımı ( Rated Current) : Bir elektrikli alet veya makinanın gerek ısınmasına, gerekse çalışmasına ilişkin yapılan hesapların dayandırıldığı olağan çalışma akım değeri.
-Anma Değeri ( Rated Value) : Bir bileşen, aygıt ya da donatım için çoğunlukla yapımcısı tarafından atanmış ve belirli çalışma koşullarında geçerli nicel değer.
-Anma Frekansı ( Rated Frequency) : Elektrikli bir aletin çalışma sınırlarının ve test koşullarının tanımlanmasını sağlamak üzere belirtilmiş frekans değeri.
-Anma Gerilimi ( Rated Voltage) : Bir elektrikli alet veya makinanın gerek gerilim sınırlarının gerekse işlemesine ilişkin hesapların dayandırıldığı gerilim değeri.
-Anma Hızı ( Rated Speed) : Döner makinalarda, bir motorun en büyük dönme hızı.
-Armatür ( Armatur) : DC veya üniversal elektrik motorlarında motorun dönen parçası.
-Aşırı Yük ( Overload) : Bir elektrikli alete veya elektrik sistemine taşıyabileceğinden çok fazla elektriğin veya yükün yüklenmesi.
-Avometre : Multimetre, Ampermetre, Voltmetre, Ohmmetre; Amper, Volt, Ohm ölçebilen elektronik cihazlardır.
-Aydınlatma Armatürü ( Lighting Fixture) : Lambaların bir veya birden çoğunu bünyesinde taşıyan onlara dekoratif bir görünüm veren ve bazen de olumsuz dış etkilerden koruyan aydınlatma araçlarıdır.
-Aydınlatma Şiddeti ( Luminous Intensity) : Aydınlanan bir yüzeyin 1 m2’sine, bu yüzeyi aydınlatan ışık kaynaklarından gelen ışık akılarının toplamıdır. Birimi Lüx (lx) veya lümen/m2
-Balast ( Ballast) : Floresan lambalarda ilk anda lambaya enerji uygulanıp flamanların ısınması sonunda, starter aracılığı ile flamanları ısıtmak ve atlama gerilimi oluşturmak ve lambanın yanmasından sonra çalışma geriliminin yaklaşık %50′si oranında gerilim düşümü meydana getirmek için kullanılan elektrik devre elemanı.
-Baskı Devre ( Printed Circuit) : Elektronik devre elemanlarının üzerine yerleştirildiği ve bu elemanlar arasındaki elektriksel bağlantının bakırlı yüzde oluşturulan yollarla sağlandığı plakalara baskı devre veya baskı devre kartı (Printed Circuit Board) (PCB) denir.
-Besleme Gerilimi ( Supply Voltage) : Bir devrenin çalışabilmesi için devreye uygulanan gerilim.
-Bobin ( Coil) : İletken bir telin nüve denilen bir malzeme üzerine ardışıl bir şekilde ve belli bir çapta sarılmasıyla elde edilen devre elemanı. Nüve yerine hava da olabilir.
-Boşalma ( Discharge) : Elektriksel potansiyeli çevresinden daha yüksek olan bir cismin yükünü yitirmesi veya gaz içerisinden akım geçmesi.
-Buat ( Conduit Box) : Elektrik tesisatlarında içerisinde iletkenlerin eklendiği ve dağıtımlarının yapıldığı ek kutularıdır.
-Buton ( Push Button) : Çağırma ve bildirim tesisatlarında devreye enerji verip kesmeye yarayan elemanlara buton denir.
-Candela ( Candela) : Bir atmosfer ( 101325 N/m2) basınç altında ve platinin ergime sıcaklığındaki ( 1769 oC ) bir siyah cismin 1/60000 m2 büyüklüğündeki yüzeyinin kendisine dik olan bir doğruda verdiği ışık şiddetine candela denir. I ile gösterilir.
-Dağıtım ( Distribution) : Elektrik enerjisinin ev, ofis gibi kullanıcılara ulaştırılması.
-Dağıtım Hattı ( Distribution System) : Elektrik enerjisini son kullanıcılara ulaştıran elektrik enerji sistemi.
-Delinme ( Breakdown) : Gazlarda istenmeyen bir boşalma etkisiyle bir aralığın direncinin, birden bire pratik olarak sonsuz olan değerden görece alçak bir değere düşmesi.
-Desibel ( Decibel) : İki sinyal seviyesinin oranını ölçen logaritmik ölçüm. dB ile gösterilir. dB=10log(Güç1/Güç2)
-Devre ( Circuit) : Elektrik akımının aktığı iletken veya iletkenlerden ve elektrik elemanlarından oluşan sistem.
-Devrilme Momenti ( Breakdown Torque) : Elektrik motorlarında bir motorun üretebileceği maksimum moment.
-Dinamo ( Dynamo) : Hareket enerjisini doğru akım elektrik enerjisine dönüştüren makinelere dinamo denir.
-Direnç ( Resistance) : Elektrik akımının akışına direnç gösteren ve iki kutbu arasında gerilim düşümüne neden olan devre elemanı. Birimi Ohm’dur. R=V/I
-Diyot ( Diode) : Anot ve katottan oluşan anodunun katoduna göre pozitif alternansta olması durumunda kapalı durumda olan ve akımı ileten kontrolsüz anahtarlama elemanı.
-Doğru Akım ( Direct Current) : Zamana göre değeri değişmesine rağmen yönü değişmeyen pozitif (+) veya negatif (-) değerde olan akım.
-Doğrultucu ( Rectifier) : Alternatif gerilimleri doğru gerilime dönüştüren devrelerdir. Tam dalga, yarım dalga, kontrollü veya kontrolsüz doğrultucular bulunmaktadır.
-Doğruluk Tablosu ( Truth Table): Lojik (sayısal) devrelerde giriş değişkenlerinin alabileceği bütün olası değerlere karşı çıkış değerlerini gösteren tasarım ve analiz tablosudur.
-Duy ( Lamp Base) : Elektrik lambasının, vidalanarak veya takılarak elektrik tesisine bağlanmasını sağlayan gereçtir
-Duyarlılık ( Sensitivity) : Ölçü aletinde ölçülen büyüklüğün çok küçük değişimlerinin skala veya göstergede ifade edilebilmesidir.
-Elektrik Dağıtımı ( Distribution) : Elektrik enerjisinin 36kV gerilim altındaki hatlar ile yerleşim birimleri içinde nakli.
-Elektrik Sayacı ( Electric Meter) : Elektrik devrelerinde alıcıların harcadığı elektrik enerjisini, yani harcanan güç ile zaman çarpımını ölçen ölçü aletleridir. sayaçlarda akım ve gerilim bobini olmak üzere iki bobin bulunur. Akım bobini devreye seri, gerilim bobine devreye paralel bağlanır.
-Elektromanyetizma ( Electromagnetism) : Elektrik akımı ile elde edilen manyetik alana genel olarak elektromanyetizma denir.
-Elektrostatik Voltmetre ( Electrostatic Voltmeter) : Elektrostatik etkiden yararlanarak iki nokta arasındaki gerilimi ölçen alete elektrostatik voltmetre denir.
-EMK ( EMF – Electro Motor Force) : Elektromotor kuvvet, elektrik devrelerinde, devrenin açık olduğu ve devreden elektrik akımı çekilmediği durumda devredeki kaynağın iki kutbu arasındaki potansiyel farka denir. Elektromotor kuvvet emk harfleri ile tanımlanır ve sembolü ise E dir. Birimi V’dir.
-Empedans ( Impedance) : Alternatif gerilim devrelerinde kaynağa bağlı olan elemanın akıma gösterdiği dirençtir. Z ile gösterilir.
-Endüktans ( Inductance) : Bobinin birimi Henry olan elektriksel değeri.
-Fider : Üretici ile müsteri arasındaki besleme hattıdır.
-Fırça ( Brush) : Elektrik motorlarında rotor akımının iletilmesi için kullanılan iletken parça.
-Fiş ( Power Plug) : Bir aygıt veya uzatma kablosundaki iletkenleri, prizdeki kontaklar aracılığı ile elektrik tesisi iletkenlerine birleştirmeyi veya bunlardan ayırmayı sağlayan bir araçtır.
-Fosil Yakıt (Fossil Fuel) : Petrol, kömür, doğalgaz gibi doğada kendiliğinden oluşan yakıtlar.
-Foto Diyot ( Photodiode) : Işığa duyarlı olarak iletime geçen diyot. Daha çok sensörlerde kullanılır.
-Foton ( Photon) : Işığı oluşturan enerji paketlerin her birine foton denir
-Frekans ( Frequency) : Alternatif akımın veya gerilimin bir saniyedeki devir sayısının Hz (hertz) birimi ile ifade edilmesi.
-Frekansmetre ( Frequency Meter) : Alternatif akım devrelerinde elektrik enerjisinin frekansını ölçen aletlerdir. Frekansmetreler devreye paralel bağlanır ve (Hz) şeklinde ifade edilir.
-Genlik ( Amplitude) : Sinüs biçimli periyodik bir büyüklüğün en yüksek değeri.
-Gerilim (Voltaj) ( Voltage) : Elektrik devresinde akım akmasına neden olan güç.
-Girdap Akımı ( Eddy Current) : Elektrik makinelerinin demir çekirdeğinde alternatif manyetik akı tarafından oluşturulan akımlar.
-Görünür Güç ( Apparent Power) : Birimi VoltAmper olan elektrik gerilimi ve akımının çarpımı ile elde edilen güç. P=VxI
-Güç Faktörü ( Power Factor) : Devredeki akım ve gerilim fazörleri arasındaki açının cosinüsüne denir. GF=cosφ
-Hava Aralığı ( Air Gap) : Elektrik motorlarında stator ve rotor arasındaki boşluk.
-Havya ( Soldering Iron) : Lehim yapmakta kullanılan ısıtıcı alet.
-Hidroelektrik Santral ( Hydroelectric Power Plant) : Su gücünün kullanılmasıyla elektrik enerjisi elde edilen santrallerdir
-HVAC ( Heating, Ventilation, and Air Conditioning) : Isıtma, soğutma ve iklimlendirme kelimelerinin ingilizce baş harflerinden oluşmuş, ısıtma, soğutma ve iklimlendirme sistemleriyle ilgilenen endüstri dalı.
-Işık Akısı ( Luminous Flux) : Işık kaynağından yayılan ve gözün değerlendirebildiği ışınıma ışık akısı denir. Birimi Lümen (Lm)’dir. Φ ile gösterilir.
-Işık Şiddeti( Intensity of Light) : Belli bir yöne doğru elde edilen, görülebilen ışınıma ışık şiddeti denir. Birimi Candela (cd)’dır.
-İletim Hattı ( Transmission Line) : Elektrik enerjisini üretim merkezlerinden dağıtım merkezlerin taşıyan yüksek gerilim hatları.
-İletken ( Conductor) : Elektrik enerji kaynağı ile elektrik enerjisini kullanacak cihaz arasındaki elektrik akımının akışını sağlayan, elektrik akımının taşındığı metal cisim.
-İnverter ( Inverter) : Doğru gerilimi alternatif gerilime dönüştüren araçlar.
-İzolatör( İnsulator) : Elektrik devre parçalarını birbirinden ayırıp akımın geçişini engelleyen malzeme.
-Jeneratör ( Generator) : Mekanik enerjiyi elektrik enerjisine çeviren elektrik makinesi
-Joule – Joule kavramı : (Joule etkisi olarak da bilinir), bir iletken üzerinden geçen elektrik akımı ile onun yarattığı ısı arasındaki ilişkiyi veren fiziksel bir kanundur.
-Kadmiyum ( Cadmium) : Simgesi Cd, atom numarası 48 olan pil yapımında kullanılan kimyasal enerji.
-Kalibrasyon ( Calibration) : Belirli koşullar altında ölçü aletlerinin ölçtüğü değerlerin doğruluğunun karşılaştırılması, ölçme hassasiyetinin belirlenmesi işlemi.
-Kalkış Akımı ( Starting Current) : Elektrik motorlarında motorun ilk kalkış anında çektiği akım. Genelde nominal akımın 5-7 katı kadar olur.
-Kapalı Devre ( Closed Circuit) : Devre anahtarının devreden akım geçecek konumda olması durumu.
-Kapasitans ( Capacitance) : Birimi Farad (F) olan kondansatörün elektrik enerjisini depo edebilme özelliğine kapasitans denir. kondansatörün elektrik enerjisini depo edebilme özelliğine kapasite denir.
-Kesinti( Outage) : Elektrik enerji üretim, iletim veya dağıtım sisteminin her hangi bir nedenden dolayı devre dışı kalması, tüketicilere enerji sağlanamaması durumu.
-Kesme Gücü ( Breaking Capacity) : Anma şartları altında belirtilmiş bir gerilimde, bir anahtarlama aygıtının ya da sigortanın kesebileceği beklenen akım değeri.
-Kinetik Enerji ( Kinetic Energy) : Hareket halindeki cisimlerin sahip oldukları enerjidir. Ek=1/2xmxV2 olarak ifade edilir. Birimi joule’dur. m=cismin kütlesi (kg) V=cismin hızı (m/s)
-Kısa Devre ( Short Circuit) : Elektrik akımının akımı kullanacak cihaz veya devre üzerinden geçmeden yolunu tamamlaması durumu.
-Klemens ( Electric Terminal) : Aydınlatma ve güç tesislerinde buat (ek kutusu) içinde eklerin (iletken bağlantılarının) yapılması için kullanılan gereçtir.
-Kojenerasyon ( Cogeneration) : Tek bir sistemde bileşik olarak hem ısı hem de elektrik gücü üretim sistemi.
-Komutatör Anahtar ( Double-Pole Switch) : İki ayrı lamba veya lamba grubunun bir yerden aynı anda veya ayrı ayrı yakılıp söndürülmesinde kullanılan anahtarlardır.
-Kondansatör ( Capacitor) : Karşılıklı duran ve aralarında fiziksel bir temas olmayan iki ayrı plaka ve plakalara bağlı iki ayrı iletken telden oluşan elektrik enerjisini depolamak amacıyla kullanılan devre elemanları.
-Kontaktör ( Contactor) : Büyük güçteki elektromanyetik anahtarlara kontaktör adı verilir.
-Kontrol Kalemi ( Neon Tester) : Bir hatta elektrik olup olmadığını kontrol etmek için kullanılan alet.
-Köprü Doğrultucu ( Bridge Rectifier) : Dör adet diyotla yapılan alternatif gerilimi doğru gerilime dönüştüren devrelerdir.
-Korona ( Corona) : Bir iletkenin yakın çevresinde oluşan, iletkenin önemli ölçüde ısınmasına yol açmayan ve iletken etrafındaki elektrik alanının belli bir değeri aştığı uzay bölümü ile sınırlanan, zayıf ışıltılı bir elektriksel boşalma.
-Kroşe ( Crochet) : Kabloların, boruların duvar veya tavana tutturulmasına yarayan pvc veya sacdan yapılan gereçlerdir
-Kumpas ( Caliper) : Milimetrenin yüzde onu, yüzde beşi ve yüzde ikisi oranında ölçüm yapılabilen aletlerdir.
-Lehim Pastası ( Soldering Flux Paste) : Lehimlenecek yüzeylerin yağdan ve zararlı kir ve oksitlerden temizlenmesini sağlayan malzeme.
-Lermetre : Elektrik devrelerinde değişik amaçlar için kullanılan ve alıcı olarak görev yapan direnç, bobin ve kondansatörün; direnç, endüktans ve kapasite değerlerini ölçen ölçü aletleridir.
-Lineer Sistem ( Linear System) : Çıkış sinyalinin direk olarak giriş sinyaline bağlı olan sistem.
-Lojik Kapıları ( Logic Gates) : Lojik (sayısal) devrelerde mantıksal işlemler (ve, veya, değil gibi) yapan elektronik devre elemanlarıdır.
-Lüksmetre ( Luxmeter) : Aydınlatma şiddetini ölçen aletlere lüksmetre denir.
-Lümen ( Lumen) : ışık şiddeti 1 candela ( cd ) olan bir nokta kaynaktan bir metre uzaklıkta, ışınlara dik olarak konmuş 1 m2 lik yüzeye gelen ışık akısıdır.
-Lüx ( Lux) : 1 m yarıçaplı küre merkezinde bulunan 1 cd şiddetindeki kaynağın 1 m2’lik küre yüzeyine yaptığı aydınlanma şiddetidir.
-Ohm ( Ohm) : Elektriksel direnci ölçme birimi. Simgesi Ω’dur.
-Ohmmetre ( Ohmmeter) : Bir direncin değerini ölçmek için kullanılan cihazdır.
-Osiloskop ( Oscilloscope) : Elektrik ve elektronik devrelerinde akım ve gerilimin değeri, frekans ve faz farkı ölçümlerini dijital veya analog ekranda grafiksel olarak gösteren aletlerdir.
-Özdirenç ( Specific Resistance) : Birim uzunluk (1 metre) ve birim kesitteki (1mm2) iletkenin direncine özdirenç denir.
-Öziletkenlik ( Specific Conductance) : Özdirencin tersine öziletkenlik denir.
-Pano ( Cubicle) : Elektrik devresinin, elektrik ekipmanlarının içerisinde bulunduğu sayaç giriş çıkışının içinde bulunduğu kutu.
-Pensampermetre ( Clamp Ammeter) : Akım ölçme işlemini daha pratik hale getirmek için ampermetre ve akım trafosu aynı gövde içerisinde birleştirilerek oluşturulmuş ölçü aletleridir. Aletin gövdesinden dışarı doğru açılan demir nüvesi, pens gibi açılıp kapanacak şekilde yapılmıştır. Böylece akımı ölçülecek iletken kesilmeden pens içerisine alınır.
-Pense ( Pliers) : İletkenleri, küçük parçaları tutmaya, çekmeye, sıkıştırmaya ve bükerek şekil vermeye yarayan bir alet olan pensenin sap kısımları izole edilmiştir.
-Periyod ( Period) : Bir saykılın tamamlanması için geçen zamana periyod denir.
-Piezoelektrik ( Piezoelectricity) : Yapısındaki atomların düzenli olarak dizilmemiş olan moleküller mekanik bir basınç altında kaldığında elektrik akımı oluşur, veya tam tersi olarak elektrik akımı verilen bu maddelerin hacminde değişiklik olur. Buna piezoelektrik denir.
-Potansiyel Enerji ( Potential Energy) : Cisimlerin bulundukları konum ya da şekil değişikliğine bağlı olarak sahip oldukları enerjidir. Ep=mxgxh olarak ifade edilir. Birimi joule’dur. m=cismin kütlesi (kg) g=yer çekimi ivmesi (m/s2) h=cismin yerden yüksekliği (m)
-Priz ( Electric Outlet) : Elektrik cihazlarına, bir elektrik devresinden fiş aracılığı ile doğrudan veya uzatma kablosu ile enerji alınması için kullanılan araçtır.
-PTC ( Positive Temperature Coefficient) : Üzerindeki sıcaklık arttıkça direnci artan, sıcaklık azaldıkça direnci azalan; yani direnci sıcaklıkla doğru orantılı olarak değişen pozitif ısı katsayılı termistörler.
-Reaktif Güç ( Reactive Power) : Birimi Var olan görünür gücün faz açısının sinüsü ile çarpımı ile elde edilen elektrik makinelerinde mıknatıslanma için kullanılan güç. Q=VxIxsinφ
-Regülasyon ( Regulation) : Gerilimi sabit tutma işlemine denir.
-Regülatör ( Regulator) : Elektrik gerilimini sabit tutan cihazlardır.
-Rezistans ( Resistance) : Elektrik enerjisinden yararlı ısı elde etmek için ihtiyaç duyulan direnç değeri yüksek ve ısıya dayanıklı iletkenlere rezistans denir.
-Röle ( Relay) : Bobin, palet ve kapak olmak üzere üç ana bölümden meydana gelen, bir elektrik devresinin açılıp kapanmasını sağlayan elektromekanik anahtarlama elemanıdır.
-Rotor ( Rotor) : Hareketli elektrik makinelerinde (motor, jeneratör) ince sac tabakalarının üst üste konulmasıyla oluşturulmuş makinenin dönen parçası.
-Rüzgar Elektrik Santrali ( Wind Power Plant) : Rüzgâr alan açık arazilerde, rüzgârın etkisiyle rüzgâr türbinlerinde elde edilen mekanik enerji alternatör yardımıyla elektrik enerjisine dönüştürülen santrallere denir.
-Saykıl ( Cycle) : Alternatif akım veya gerilim sıfırdan başlar, maksimum değerini alır ve sıfıra döner, ters yönde de aynı işlem gerçekleşerek tekrar başlangıç noktası sıfıra döner. Akım veya gerilimin her iki yöndeki bütün değerleri almasına denir.
-Selenoid ( Selenoid) : Üzerindeki bobine enerji verilince kullanıldığı yere göre sıvı ve hava geçişini kontrol etmeye yarayan elektromekanik vanadır.
-Senkron ( Synchronous) : Eş zamanlı. Elektrik motorlarında döner alanın devir sayısına senkron hız denir.
-Sigorta ( Fuse) : Alternatif veya doğru akım devrelerinde elektrik tesisatını, tesisata bağlanan elektrikli aletleri veya elektrik devrelerini aşırı akımlara karşı korumaya yarayan açma elemanıdır.
-Sorti : Enerjinin anahtar prize getirilmesine kadar oluşan tesisat.
-Starter ( Fluorescent Starter) : İçi neon gazı ile doldurulmuş cam bir balon içinde iki elektrodu bulunan silindir şeklinde bimetal şeritten oluşmuş floresan lambalarda ilk ateşlemeyi sağlayan elektrik devre elemanı.
-Şönt Kapasitör ( Shunt Capacitor) : Reaktif (kapasitif) güç üreten sisteme paralel bağlı olan kondansatör grubu.
-Takometre ( Tachometer) : Devir sayısını ölçen aletlere takometre denir.
-Talep Güç ( Demand Power) : Enerji hattına bağlı olan yüklerin çalışması için ihtiyaç duyulan güç.
-Termik Elektrik Santrali ( Thermal Power Plant) : Kömür, doğalgaz, petrol ürünleri gibi fosil yakıtların yanmasıyla elde edilen ısı enerjisini kullanarak elektrik üreten santrallere termik elektrik santrali denir.
-Termokupl ( Thermocouple) : İki farklı metalden yapılmış, sıcaklığı okuyarak elektrik sinyaline çeviren sıcaklık ölçüm aracı.
-Topraklama ( Grounding) : Gerilim altında olmayan bütün tesisat kısımlarının, uygun iletkenlerle toprak kitlesi içerisine yerleştirilmiş bir iletken cisme (elektrot) bağlanmasıdır
-Topraklama Menholü ( Grounding Manhole) : Topraklama iletkenlerinin bağlandığı topraklama elektrodunun toprağa gömüldüğü kuyu.
-Tornavida ( Screw Driver) : Vidaları söküp takmaya yarayan alet. Farklı uçlarda tornavidalar bulunmasına rağmen en çok kullanılanı yıldız uçlu ve düz uçlu olan tornavidalarardır.
-Transformatör –  Trafo ( Transformer) : Alternatif elektrik gerilimini veya akımını belirli oranda dönüştüren veya yükselten elektrik makinası. Giriş ve çıkış bobinlerinin sarım sayıları oranına göre çıkış gerilimi yükselir veya düşer.
-Transistör ( Transistor) : Girişine uygulanan sinyali yükselterek gerilim ve akım kazancı sağlayan, gerektiğinde anahtarlama elemanı olarak kullanılan yarı iletken bir elektronik devre elemanıdır. Base, Emiter ve Kollektör uçları bulunan transistörlerde PNP veya NPN olmak üzere iki çeşittir.
-Vaviyen Anahtar ( Three-Way Switch) : Bir lambayı veya bir grup lambayı iki ayrı yerden aynı zamanda veya farklı zamanlarda yakıp söndüren anahtar çeşididir.
-Volt ( Volt) : akım, direnç, gerilim, potansiyel fark, volt
-Voltmetre ( Voltmeter) : Doğru ve alternatif akım devresinin ya da devreye bağlı bir alıcının uçlarındaki gerilim değerini ölçmeye yarayan ölçü aleti olup devreye paralel bağlanır. Voltmetreler (V) harfi ile belirtilir.
-Wattmetre ( Wattmeter) : Doğru ve alternatif akım devrelerinde alıcıların çektikleri elektriksel gücü ölçen aletleridir. Wattmetreler akım ve gerilim bobinlerine sahip olup akım bobini devreye seri, gerilim bobini devreye paralel bağlanır. Güç hesaplamalarda (P) harfi ile ifade edilir.
-Yan Keski( Side Cutter) : İletkenleri kesmek amacıyla kullanılan pense türü bir alet.
-Yarı İletken ( Semiconductor) : Elektrik akımını çok az ileten materyaller. Silikon, Germanyum başlıca yarı iletkenlerdir.
-Yük ( Load) [Elektriksel Yük] : Belli bir miktar enerji tüketen, enerji hattından güç çeken sistem.
-Yüksek Geçiren Filtre ( High Pass Filter) : Yüksek frekanslı sinyalleri geçiren düşük frekansları engelleyen filtre devresi.
-Yüksek Gerilim : ( High Voltage) Elektrik enerji sistemlerinde 100.000 volttan yüksek gerilimler.
-"""
 
-# Read existing JSON file
-with open(file_path, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-new_entries = []
-
-for line in raw_data.strip().split('\n'):
-    line = line.strip()
-    if not line:
-        continue
-
-    # Improved Regex Patterns (More robust)
-    
-    # Pattern 1: TR (EN) ... : Def
-    # Handles cases where there might be extra brackets like [Elektriksel Yük] before the colon
-    match1 = re.match(r'^(.+?)\s*\(\s*(.+?)\s*\).*?[:]\s*(.+)$', line)
-    
-    # Pattern 2: TR : (EN) Def
-    match2 = re.match(r'^(.+?)\s*[:]\s*\(\s*(.+?)\s*\)\s*(.+)$', line)
-    
-    # Pattern 3: TR : Def
-    match3 = re.match(r'^(.+?)\s*[:]\s*(.+)$', line)
-
-    term = ""
-    tr = ""
-    definition = ""
-    
-    if match1:
-        tr = match1.group(1).strip()
-        term = match1.group(2).strip()
-        definition = match1.group(3).strip()
-    elif match2:
-        tr = match2.group(1).strip()
-        term = match2.group(2).strip()
-        definition = match2.group(3).strip()
-    elif match3:
-        tr = match3.group(1).strip()
-        definition = match3.group(2).strip()
-        term = tr # Fallback if no english found
+def _tally(results, stats, verbose):
+    for result in results:
+        if isinstance(result, str):
+            stats.skipped += 1
+            if verbose:
+                print(f"Skipping line: {result}", file=sys.stderr)
+            continue
+        stats.accepted += 1
+        stats.patterns[result.pattern] += 1
+        yield result
+
+
+def parse_lines(lines, stats, verbose=False):
+    return _tally(_iter_parsed(lines), stats, verbose)
+
+
+def chunk_ranges(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Split a file into (start, end) byte ranges that each end on a line boundary."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(start + chunk_size)
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def _parse_file_chunk(path, start, end):
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    # newline=None gives the same line splitting as reading the file in text mode
+    text = raw.decode("utf-8-sig" if start == 0 else "utf-8")
+    return list(_iter_parsed(io.StringIO(text, newline=None)))
+
+
+def _parse_line_batch(lines):
+    return list(_iter_parsed(lines))
+
+
+def _iter_batches(lines, size):
+    while True:
+        batch = list(itertools.islice(lines, size))
+        if not batch:
+            return
+        yield (batch,)
+
+
+def _ordered_results(executor, fn, arg_tuples, window):
+    # Keeps at most `window` chunks in flight and yields their results in submission order
+    pending = collections.deque()
+    for args in arg_tuples:
+        pending.append(executor.submit(fn, *args))
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def parse_chunks(executor, source, stats, verbose=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                 window=8):
+    """Parse ``source`` in a process pool, yielding results in input order.
+
+    Files are split into line-aligned byte ranges; stdin, which cannot be seeked,
+    is sent to the workers in batches of lines instead. At most ``window`` chunks
+    are in flight at once.
+    """
+    if source == STDIN_SOURCE:
+        batches = _iter_batches(_stdin_lines(), CHUNK_LINES)
+        results = _ordered_results(executor, _parse_line_batch, batches, window)
     else:
-        # If no regex matches, it might be a weird line.
-        # Let's try to split by colon as last resort
-        if ':' in line:
-            parts = line.split(':', 1)
-            tr = parts[0].strip()
-            definition = parts[1].strip()
-            term = tr
+        ranges = ((source, start, end) for start, end in chunk_ranges(source, chunk_size))
+        results = _ordered_results(executor, _parse_file_chunk, ranges, window)
+    return _tally(results, stats, verbose)
+
+
+def normalize_entries(parsed_lines, category):
+    for tr, term, definition, _ in parsed_lines:
+        # English terms first: 'term' is the english one, 'tr' the turkish one
+        yield {
+            "term": term,
+            "tr": tr,
+            "category": category,
+            "definition": definition,
+        }
+
+
+class Profiler:
+    """Exclusive wall time per pipeline stage, for --profile.
+
+    Stages nest: time spent in an inner stage (e.g. "parse" pulled from inside
+    "merge") is not counted again in the outer one. A disabled profiler costs
+    nothing but the calls.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.times = {}
+        self._stack = []
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            outer, started = self._stack[-1]
+            self.times[outer] = self.times.get(outer, 0.0) + now - started
+        self._stack.append((name, now))
+
+    def _exit(self):
+        now = time.perf_counter()
+        name, started = self._stack.pop()
+        self.times[name] = self.times.get(name, 0.0) + now - started
+        if self._stack:
+            self._stack[-1] = (self._stack[-1][0], now)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def wrap(self, name, iterable):
+        """Count the time spent producing each item of ``iterable`` towards ``name``."""
+        if not self.enabled:
+            return iterable
+        return self._wrap(name, iter(iterable))
+
+    def _wrap(self, name, iterator):
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            yield item
+
+
+def profile_report(profiler, report, wall_time, peak_memory):
+    patterns = collections.Counter({pattern: 0 for pattern in PATTERNS})
+    for stats in report:
+        patterns.update(stats.patterns)
+    lines = sum(stats.accepted + stats.skipped for stats in report)
+    return {
+        "wall_time": wall_time,
+        "stages": dict(profiler.times),
+        "peak_memory_bytes": peak_memory,
+        "lines": lines,
+        "lines_per_second": lines / wall_time if wall_time else 0.0,
+        "patterns": dict(patterns, skipped=sum(stats.skipped for stats in report)),
+    }
+
+
+def format_profile(profile):
+    wall_time = profile["wall_time"] or 1.0
+    rows = ["Profile:", f"  {'stage':<14}{'seconds':>10}{'share':>9}"]
+    for stage, seconds in profile["stages"].items():
+        rows.append(f"  {stage:<14}{seconds:>10.3f}{seconds / wall_time:>9.1%}")
+    rows.append(f"  {'total':<14}{profile['wall_time']:>10.3f}")
+    rows.append(f"  peak memory   {profile['peak_memory_bytes'] / 2 ** 20:>10.1f} MiB "
+                "(tracemalloc, main process)")
+    rows.append(f"  throughput    {profile['lines_per_second']:>10,.0f} lines/sec")
+    rows.append("  patterns      " + ", ".join(
+        f"{pattern} {count}" for pattern, count in profile["patterns"].items()))
+    return "\n".join(rows)
+
+
+def is_pdf(source):
+    return source.lower().endswith(".pdf")
+
+
+def iter_entries(sources, category, report, verbose=False, workers=1,
+                 chunk_size=DEFAULT_CHUNK_SIZE, pdf_cache=pdf_glossary.DEFAULT_CACHE_DIR,
+                 profiler=None):
+    """Stream normalized entries from every source, recording a SourceStats per source.
+
+    With ``workers`` > 1 the lines are parsed in a process pool; the entries come
+    out in the same order as a single-process run. PDF sources are reduced to
+    their glossary lines by pdf_glossary, which extracts pages in its own pool.
+    """
+    profiler = profiler or Profiler(enabled=False)
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ProcessPoolExecutor(workers)) if workers > 1 else None
+        for source in sources:
+            stats = SourceStats("<stdin>" if source == STDIN_SOURCE else source)
+            report.append(stats)
+            if is_pdf(source):
+                lines = pdf_glossary.read_pdf_lines(source, workers, pdf_cache)
+                parsed = parse_lines(profiler.wrap("read", lines), stats, verbose)
+            elif executor is None:
+                lines = profiler.wrap("read", read_lines(source))
+                parsed = parse_lines(lines, stats, verbose)
+            else:
+                # Workers read and parse; the main process only waits for their results
+                parsed = parse_chunks(executor, source, stats, verbose, chunk_size, 2 * workers)
+            parsed = profiler.wrap("parse", parsed)
+            yield from profiler.wrap("normalize", normalize_entries(parsed, category))
+
+
+def normalize_key(text):
+    """Fold a term for matching: lowercase with all i variants folded, no brackets, single spaces."""
+    text = _BRACKETS_RE.sub(" ", text or "")
+    return _SPACES_RE.sub(" ", text.translate(_I_FOLD).lower()).strip()
+
+
+def entry_key(entry):
+    return normalize_key(entry.get("term")), normalize_key(entry.get("tr"))
+
+
+class DictionaryIndex:
+    """Hash index over dictionary entries keyed by their normalized (term, tr) pair.
+
+    Built once from the existing dictionary, after which every incoming entry is a
+    single dict lookup. Entries that are new are collected in ``appended``; the
+    "overwrite" and "merge" policies update the indexed entry in place. Entries
+    that existed before are compared with their state before the run, so
+    ``changed`` holds only those that really differ at the end: an input that
+    overwrites one entry twice, and ends where it started, changes nothing.
+    """
+
+    def __init__(self, entries=()):
+        self.by_key = {}
+        self.appended = []
+        self._original = {}
+        self._appended_keys = set()
+        self.added = 0
+        self.duplicates = 0
+        for entry in entries:
+            # Keep the first occurrence if the dictionary already holds duplicates
+            self.by_key.setdefault(entry_key(entry), entry)
+
+    def add(self, entry, policy="skip"):
+        key = entry_key(entry)
+        existing = self.by_key.get(key)
+        if existing is None:
+            self.by_key[key] = entry
+            self.appended.append(entry)
+            self._appended_keys.add(key)
+            self.added += 1
+            return "added"
+
+        self.duplicates += 1
+        if policy != "skip" and key not in self._appended_keys:
+            self._original.setdefault(key, dict(existing))
+        if policy == "overwrite":
+            changed = existing != entry
+            existing.clear()
+            existing.update(entry)
+        elif policy == "merge":
+            changed = merge_entry(existing, entry)
         else:
-            print(f"Skipping line: {line}")
+            changed = False
+        if changed:
+            return "updated"
+        return "duplicate"
+
+    @property
+    def changed(self):
+        """Existing entries whose content differs from before the run, by key."""
+        return {key: self.by_key[key] for key, original in self._original.items()
+                if self.by_key[key] != original}
+
+    @property
+    def updated(self):
+        return len(self.changed)
+
+
+def merge_entry(existing, entry):
+    """Fold ``entry`` into ``existing``; returns True if anything changed."""
+    changed = False
+    for field, value in entry.items():
+        if value and not existing.get(field):
+            existing[field] = value
+            changed = True
+
+    definition = entry.get("definition", "")
+    current = existing.get("definition", "")
+    known = {normalize_key(part) for part in current.split(MERGE_SEPARATOR)}
+    if definition and normalize_key(definition) not in known:
+        existing["definition"] = f"{current}{MERGE_SEPARATOR}{definition}"
+        changed = True
+    return changed
+
+
+def _indent(text, prefix):
+    return text.replace("\n", "\n" + prefix)
+
+
+def write_curriculum(f, data, new_entries):
+    """Write ``data`` as json.dump(indent=4) would, streaming new_entries onto the dictionary.
+
+    Returns the number of entries appended.
+    """
+    appended = 0
+    f.write("{")
+    keys = list(data)
+    if "dictionary" not in data:
+        keys.append("dictionary")
+    for i, key in enumerate(keys):
+        f.write("," if i else "")
+        f.write(f"\n    {json.dumps(key, ensure_ascii=False)}: ")
+        if key != "dictionary":
+            f.write(_indent(json.dumps(data[key], indent=4, ensure_ascii=False), "    "))
             continue
 
-    # Cleanup terms
-    if "–" in term:
-        term = term.split("–")[0].strip()
-    if "–" in tr:
-        tr = tr.split("–")[0].strip()
-        
-    # User Request: "English terms first"
-    # So we want 'term' field to be the english one.
-    
-    # Check for duplicates? User said "just add them", but avoiding raw duplicates is good.
-    # We will assume they are new.
-
-    entry = {
-        "term": term,
-        "tr": tr,
-        "category": "Engineering",
-        "definition": definition
+        count = 0
+        for entry in data.get("dictionary", []):
+            f.write("[" if count == 0 else ",")
+            f.write("\n        " + _indent(json.dumps(entry, indent=4, ensure_ascii=False), "        "))
+            count += 1
+        for entry in new_entries:
+            f.write("[" if count == 0 else ",")
+            f.write("\n        " + _indent(json.dumps(entry, indent=4, ensure_ascii=False), "        "))
+            count += 1
+            appended += 1
+        f.write("\n    ]" if count else "[]")
+    f.write("\n}")
+    return appended
+
+
+# Search index: entries sorted by Turkish collation, a letter -> offset table and an
+# inverted index sharded by the first character of each token. Tokens are the
+# 1..NGRAM_SIZE-grams of the normalized term, tr and definition: a query of up to
+# NGRAM_SIZE characters is answered by its own postings, a longer one by
+# intersecting the postings of its NGRAM_SIZE-grams. Postings are delta-encoded
+# entry offsets.
+SEARCH_INDEX_VERSION = 2
+NGRAM_SIZE = 3
+SEARCHED_FIELDS = ("term", "tr", "definition")
+ENTRY_FIELDS = ("term", "tr", "category", "definition")
+TR_ALPHABET = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+_COLLATION = {ch: 1000 + i for i, ch in enumerate(TR_ALPHABET)}
+
+
+def collation_key(text):
+    """Sort key ordering text by the Turkish alphabet (ç after c, ı before i, ...)."""
+    folded = text.translate(_TR_CASEFOLD).lower()
+    return [_COLLATION.get(ch, ord(ch) + (2000 if ch.isalpha() else 0)) for ch in folded], text
+
+
+def group_letter(term):
+    return term[:1].translate(_TR_UPPER).upper()
+
+
+def search_text(entry):
+    return [normalize_key(entry.get(field)) for field in SEARCHED_FIELDS]
+
+
+def index_tokens(entry):
+    # Every 1- to NGRAM_SIZE-gram, so a query up to NGRAM_SIZE long is a single
+    # exact lookup wherever in a word it occurs, as with a substring filter
+    tokens = set()
+    for text in search_text(entry):
+        for n in range(1, NGRAM_SIZE + 1):
+            for i in range(len(text) - n + 1):
+                tokens.add(text[i:i + n])
+    return tokens
+
+
+def shard_name(token):
+    return f"{ord(token[0]):04x}.json"
+
+
+def build_search_index(entries):
+    """Return (manifest, shards) for ``entries``; shards maps file name -> {token: postings}."""
+    ordered = sorted(entries, key=lambda entry: collation_key(entry.get("term", "")))
+    letters = {}
+    postings = collections.defaultdict(list)
+    for offset, entry in enumerate(ordered):
+        span = letters.setdefault(group_letter(entry.get("term", "")), [offset, offset])
+        span[1] = offset + 1
+        for token in index_tokens(entry):
+            postings[token].append(offset)
+
+    shards = collections.defaultdict(dict)
+    for token in sorted(postings):
+        offsets = postings[token]
+        shards[shard_name(token)][token] = [offsets[0]] + [
+            b - a for a, b in zip(offsets, offsets[1:])]
+
+    manifest = {
+        "version": SEARCH_INDEX_VERSION,
+        "ngram": NGRAM_SIZE,
+        "fields": list(ENTRY_FIELDS),
+        "count": len(ordered),
+        "letters": letters,
+        "shards": sorted(shards),
+        "entries": [[entry.get(field, "") for field in ENTRY_FIELDS] for entry in ordered],
     }
-    new_entries.append(entry)
+    return manifest, shards
+
+
+def write_search_index(directory, entries):
+    manifest, shards = build_search_index(entries)
+    shard_dir = os.path.join(directory, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+    for name, tokens in shards.items():
+        atomic_write_json(os.path.join(shard_dir, name), tokens, separators=(",", ":"))
+    # The manifest goes after the shards and stale shards are removed after it,
+    # so a reader never sees it point at missing shards
+    atomic_write_json(os.path.join(directory, "index.json"), manifest, separators=(",", ":"))
+    for name in os.listdir(shard_dir):
+        if name not in shards:
+            os.remove(os.path.join(shard_dir, name))
+    return manifest
+
+
+class SearchIndex:
+    """Reader for a directory written by write_search_index.
+
+    Mirrors what the client does: load index.json, fetch shards on demand and
+    answer a query from postings instead of scanning every entry.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        self.entries = self.manifest["entries"]
+        self.ngram = self.manifest["ngram"]
+        self._shards = {}
+        self._texts = {}
+
+    def _postings(self, token):
+        name = shard_name(token)
+        if name not in self._shards:
+            path = os.path.join(self.directory, "shards", name)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    self._shards[name] = json.load(f)
+            else:
+                self._shards[name] = {}
+        offsets, total = [], 0
+        for delta in self._shards[name].get(token, ()):
+            total += delta
+            offsets.append(total)
+        return offsets
+
+    def _text(self, offset):
+        if offset not in self._texts:
+            entry = dict(zip(self.manifest["fields"], self.entries[offset]))
+            self._texts[offset] = "\n".join(search_text(entry))
+        return self._texts[offset]
+
+    def search(self, query):
+        """Offsets of matching entries, in collation order."""
+        query = normalize_key(query)
+        if not query:
+            return list(range(len(self.entries)))
+        if len(query) <= self.ngram:
+            return self._postings(query)
+
+        grams = sorted({query[i:i + self.ngram] for i in range(len(query) - self.ngram + 1)},
+                       key=lambda gram: len(self._postings(gram)))
+        candidates = set(self._postings(grams[0]))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(self._postings(gram))
+        # n-grams can co-occur without being adjacent, so confirm the substring
+        return sorted(offset for offset in candidates if query in self._text(offset))
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Import glossary lines into the dictionary of master-curriculum.json.")
+    parser.add_argument("inputs", nargs="+",
+                        help="glossary files, PDFs or glob patterns, '-' reads from stdin")
+    parser.add_argument("--curriculum", default=DEFAULT_CURRICULUM,
+                        help="curriculum JSON to update (default: data/master-curriculum.json)")
+    parser.add_argument("--category", default="Engineering",
+                        help="category assigned to imported entries (default: Engineering)")
+    parser.add_argument("--on-duplicate", choices=DUPLICATE_POLICIES, default="skip",
+                        help="what to do with entries already in the dictionary: keep the "
+                             "existing one (skip), replace it (overwrite) or append the new "
+                             "definition to it (merge); default: skip")
+    parser.add_argument("--workers", type=positive_int, default=1,
+                        help="parse input, and extract PDF pages, in N worker processes; "
+                             "output is identical to a single-process run (default: 1)")
+    parser.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help="bytes of input per worker task (default: 4 MiB)")
+    parser.add_argument("--pdf-cache", default=pdf_glossary.DEFAULT_CACHE_DIR,
+                        help="cache of extracted PDF pages (default: .cache/pdf-glossary)")
+    parser.add_argument("--store", metavar="DIR",
+                        help="keep categories and dictionary as separate shards in DIR and "
+                             "append imports as JSONL segments; created from --curriculum "
+                             "on first use")
+    parser.add_argument("--compact", action="store_true",
+                        help="with --store, compact the segments and regenerate --curriculum")
+    parser.add_argument("--compact-every", type=int, default=DEFAULT_COMPACT_EVERY,
+                        help="with --store, compact once there are more than N segments "
+                             f"(default: {DEFAULT_COMPACT_EVERY})")
+    parser.add_argument("--search-index", nargs="?", const=DEFAULT_SEARCH_INDEX, metavar="DIR",
+                        help="rebuild the prebuilt dictionary search index in DIR when the "
+                             "import changes the dictionary, or when DIR has no index yet "
+                             "(default DIR: data/dictionary-index)")
+    parser.add_argument("--profile", action="store_true",
+                        help="report wall time per stage, peak memory and parse pattern "
+                             "counts (tracemalloc slows the run down)")
+    parser.add_argument("--profile-json", metavar="PATH",
+                        help="also write the profile as JSON to PATH ('-' for stdout); "
+                             "implies --profile")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="parse and report counts without writing the curriculum")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print every skipped line")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    # Bad input is reported before anything is read or written
+    try:
+        sources = list(expand_sources(args.inputs))
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    has_store = bool(args.store) and CurriculumStore(args.store).exists()
+    if not has_store and not os.path.isfile(args.curriculum):
+        parser.error(f"curriculum file not found: {args.curriculum}")
+    profiler = Profiler(enabled=bool(args.profile or args.profile_json))
+    if profiler.enabled:
+        tracemalloc.start()
+    started = time.perf_counter()
+
+    store = CurriculumStore(args.store, key=entry_key) if args.store else None
+    with profiler.stage("load"):
+        # A dry run never creates the store; until there is one, --curriculum is read
+        if store is not None and not store.exists() and not args.dry_run:
+            store.init_from(args.curriculum)
+        if store is not None and store.exists():
+            dictionary = store.load_dictionary()
+        else:
+            # Read existing JSON file
+            with open(args.curriculum, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            dictionary = data.get("dictionary", [])
+        index = DictionaryIndex(dictionary)
+
+    report = []
+    entries = iter_entries(sources, args.category, report,
+                           args.verbose, args.workers, args.chunk_size, args.pdf_cache,
+                           profiler)
+    # Dedup runs here, on the merged stream, so it sees entries in input order
+    with profiler.stage("merge"):
+        for entry in entries:
+            index.add(entry, args.on_duplicate)
+
+    if not args.dry_run:
+        with profiler.stage("write"):
+            if store is not None:
+                store.append(index.appended, index.changed.values())
+                if args.compact or len(store.load_manifest()["segments"]) > args.compact_every:
+                    store.compact(args.curriculum)
+            elif index.added or index.updated:
+                atomic_write(args.curriculum, lambda f: write_curriculum(f, data, index.appended))
+
+        if args.search_index and (index.added or index.updated or not os.path.exists(
+                os.path.join(args.search_index, "index.json"))):
+            with profiler.stage("search_index"):
+                write_search_index(args.search_index,
+                                   itertools.chain(dictionary, index.appended))
+
+    for stats in report:
+        print(stats)
+    if args.dry_run:
+        target = "(dry run)"
+    else:
+        target = os.path.basename(os.path.normpath(args.store or args.curriculum))
+    print(f"Successfully added {index.added} entries to {target} "
+          f"({index.duplicates} duplicates, {index.updated} updated, policy: {args.on_duplicate})")
 
-# Append to dictionary
-if "dictionary" in data:
-    data["dictionary"].extend(new_entries)
-else:
-    data["dictionary"] = new_entries
+    if profiler.enabled:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        profile = profile_report(profiler, report, time.perf_counter() - started, peak_memory)
+        print(format_profile(profile))
+        if args.profile_json == "-":
+            print(json.dumps(profile, indent=4))
+        elif args.profile_json:
+            atomic_write_json(args.profile_json, profile, indent=4)
+    return 0
 
-# Write back to file with proper formatting
-with open(file_path, "w", encoding="utf-8") as f:
-    json.dump(data, f, indent=4, ensure_ascii=False)
 
-print(f"Successfully added {len(new_entries)} entries to master-curriculum.json")
+if __name__ == "__main__":
+    sys.exit(main())
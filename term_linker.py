@@ -0,0 +1,162 @@
+"""Link dictionary entries to the curriculum subtopics that mention them.
+
+Usage:
+    python term_linker.py [--curriculum PATH] [--store DIR] [--output PATH]
+
+Every normalized dictionary term and tr string goes into one Aho-Corasick
+automaton, which then scans the title, keywords and en of every subtopic in a
+single pass. Matching is linear in the scanned text (plus the number of
+matches), however many terms there are. The result is written as a
+term -> subtopic ids table, data/dictionary-links.json by default. That file
+is a build artifact: it is not committed and the app does not read it.
+
+The categories always come from --curriculum, which the scripts/ tools edit in
+place; with --store only the dictionary is read from the store.
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+
+from curriculum_index import compile_tree
+from curriculum_store import CurriculumStore, atomic_write_json
+from process_dictionary import DEFAULT_CURRICULUM, ROOT_DIR, entry_key, normalize_key
+
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, "data", "dictionary-links.json")
+LINKS_VERSION = 1
+SUBTOPIC_DEPTH = 2
+# Shorter patterns ("a", "ac") match inside too many unrelated titles
+MIN_PATTERN_LENGTH = 3
+
+
+class Automaton:
+    """Aho-Corasick automaton mapping patterns to lists of values."""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.values = [[]]
+        self.lengths = [0]
+        self.output_link = [0]
+        self._built = False
+
+    def add(self, pattern, value):
+        state = 0
+        for ch in pattern:
+            next_state = self.goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][ch] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.values.append([])
+                self.lengths.append(self.lengths[state] + 1)
+                self.output_link.append(0)
+            state = next_state
+        self.values[state].append(value)
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth first; must run after the last add()."""
+        queue = collections.deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(ch, 0)
+                # Nearest suffix state that ends a pattern, so matching skips the rest
+                link = self.fail[child]
+                self.output_link[child] = link if self.values[link] else self.output_link[link]
+                queue.append(child)
+        self._built = True
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) for every pattern occurrence in ``text``."""
+        if not self._built:
+            self.build()
+        goto, fail, values, lengths, output_link = (
+            self.goto, self.fail, self.values, self.lengths, self.output_link)
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            match = state if values[state] else output_link[state]
+            while match:
+                start = end - lengths[match]
+                for value in values[match]:
+                    yield start, end, value
+                match = output_link[match]
+
+
+def _is_word_boundary(text, start, end):
+    # Keeps "volt" from matching inside "voltmetre"
+    return ((start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum()))
+
+
+def build_automaton(dictionary):
+    automaton = Automaton()
+    for number, entry in enumerate(dictionary):
+        for pattern in set(entry_key(entry)):
+            if len(pattern) >= MIN_PATTERN_LENGTH:
+                automaton.add(pattern, number)
+    automaton.build()
+    return automaton
+
+
+def subtopic_texts(categories):
+    """Yield (subtopic id, normalized text) for the title, keywords and en of every subtopic."""
+    tree = compile_tree(categories)
+    for i, node_id in enumerate(tree.ids):
+        if tree.depths[i] < SUBTOPIC_DEPTH:
+            continue
+        for text in (tree.titles[i], *tree.keywords[i], tree.ens[i]):
+            yield node_id, normalize_key(text)
+
+
+def link_terms(dictionary, categories):
+    """Return {term: [subtopic ids]} for every dictionary term mentioned by a subtopic."""
+    automaton = build_automaton(dictionary)
+    linked = collections.defaultdict(dict)  # entry number -> ordered set of subtopic ids
+    for node_id, text in subtopic_texts(categories):
+        for start, end, number in automaton.iter_matches(text):
+            if _is_word_boundary(text, start, end):
+                linked[number][node_id] = None
+
+    links = collections.defaultdict(dict)
+    for number in sorted(linked):
+        links[dictionary[number]["term"]].update(linked[number])
+    return {term: list(ids) for term, ids in links.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cross-reference dictionary terms with the curriculum subtopics.")
+    parser.add_argument("--curriculum", default=DEFAULT_CURRICULUM,
+                        help="curriculum JSON to read (default: data/master-curriculum.json)")
+    parser.add_argument("--store", metavar="DIR",
+                        help="read the dictionary from a curriculum store instead")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="links file to write (default: data/dictionary-links.json)")
+    args = parser.parse_args(argv)
+
+    with open(args.curriculum, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    categories, dictionary = data.get("categories", []), data.get("dictionary", [])
+    if args.store:
+        dictionary = CurriculumStore(args.store, key=entry_key).load_dictionary()
+
+    links = link_terms(dictionary, categories)
+    atomic_write_json(args.output, {"version": LINKS_VERSION, "links": links}, indent=4)
+    print(f"Linked {len(links)} of {len(dictionary)} terms to "
+          f"{len({i for ids in links.values() for i in ids})} subtopics in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())